@@ -30,6 +30,7 @@ from esphome.cpp_generator import (  # noqa
     add_global,
     add_library,
     add_build_flag,
+    add_build_flags,
     add_define,
     add_platformio_option,
     get_variable,
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Union, Optional
 from pathlib import Path
+import functools
 import logging
 import os
 import esphome.final_validate as fv
@@ -63,23 +64,24 @@ _LOGGER = logging.getLogger(__name__)
 CODEOWNERS = ["@esphome/core"]
 AUTO_LOAD = ["preferences"]
 
+_POST_BUILD_SCRIPT = os.path.join(os.path.dirname(__file__), "post_build.py.script")
+
 
 def set_core_data(config):
-    CORE.data[KEY_ESP32] = {}
-    CORE.data[KEY_CORE][KEY_TARGET_PLATFORM] = PLATFORM_ESP32
+    core_data = CORE.data[KEY_CORE]
+    esp32_data = CORE.data[KEY_ESP32] = {}
+    core_data[KEY_TARGET_PLATFORM] = PLATFORM_ESP32
     conf = config[CONF_FRAMEWORK]
     if conf[CONF_TYPE] == FRAMEWORK_ESP_IDF:
-        CORE.data[KEY_CORE][KEY_TARGET_FRAMEWORK] = "esp-idf"
-        CORE.data[KEY_ESP32][KEY_SDKCONFIG_OPTIONS] = {}
-        CORE.data[KEY_ESP32][KEY_COMPONENTS] = {}
+        core_data[KEY_TARGET_FRAMEWORK] = "esp-idf"
+        esp32_data[KEY_SDKCONFIG_OPTIONS] = {}
+        esp32_data[KEY_COMPONENTS] = {}
     elif conf[CONF_TYPE] == FRAMEWORK_ARDUINO:
-        CORE.data[KEY_CORE][KEY_TARGET_FRAMEWORK] = "arduino"
-    CORE.data[KEY_CORE][KEY_FRAMEWORK_VERSION] = cv.Version.parse(
-        config[CONF_FRAMEWORK][CONF_VERSION]
-    )
-    CORE.data[KEY_ESP32][KEY_BOARD] = config[CONF_BOARD]
-    CORE.data[KEY_ESP32][KEY_VARIANT] = config[CONF_VARIANT]
-    CORE.data[KEY_ESP32][KEY_EXTRA_BUILD_FILES] = {}
+        core_data[KEY_TARGET_FRAMEWORK] = "arduino"
+    core_data[KEY_FRAMEWORK_VERSION] = cv.Version.parse(conf[CONF_VERSION])
+    esp32_data[KEY_BOARD] = config[CONF_BOARD]
+    esp32_data[KEY_VARIANT] = config[CONF_VARIANT]
+    esp32_data[KEY_EXTRA_BUILD_FILES] = {}
 
     return config
 
@@ -135,6 +137,9 @@ def only_on_variant(*, supported=None, unsupported=None):
 class RawSdkconfigValue:
     """An sdkconfig value that won't be auto-formatted"""
 
+    # dataclass(slots=True) needs Python 3.10
+    __slots__ = ("value",)
+
     value: str
 
 
@@ -163,15 +168,17 @@ def add_idf_component(
         raise ValueError("Not an esp-idf project")
     if components is None:
         components = []
-    if name not in CORE.data[KEY_ESP32][KEY_COMPONENTS]:
-        CORE.data[KEY_ESP32][KEY_COMPONENTS][name] = {
+    CORE.data[KEY_ESP32][KEY_COMPONENTS].setdefault(
+        name,
+        {
             KEY_REPO: repo,
             KEY_REF: ref,
             KEY_PATH: path,
             KEY_REFRESH: refresh,
             KEY_COMPONENTS: components,
             KEY_SUBMODULES: submodules,
-        }
+        },
+    )
 
 
 def add_extra_script(stage: str, filename: str, path: str):
@@ -183,13 +190,9 @@ def add_extra_script(stage: str, filename: str, path: str):
 
 def add_extra_build_file(filename: str, path: str) -> bool:
     """Add an extra build file to the project."""
-    if filename not in CORE.data[KEY_ESP32][KEY_EXTRA_BUILD_FILES]:
-        CORE.data[KEY_ESP32][KEY_EXTRA_BUILD_FILES][filename] = {
-            KEY_NAME: filename,
-            KEY_PATH: path,
-        }
-        return True
-    return False
+    extra_build_files = CORE.data[KEY_ESP32][KEY_EXTRA_BUILD_FILES]
+    build_file = {KEY_NAME: filename, KEY_PATH: path}
+    return extra_build_files.setdefault(filename, build_file) is build_file
 
 
 def _format_framework_arduino_version(ver: cv.Version) -> str:
@@ -232,32 +235,56 @@ RECOMMENDED_ESP_IDF_FRAMEWORK_VERSION = cv.Version(4, 4, 5)
 #  - https://api.registry.platformio.org/v3/packages/platformio/platform/espressif32
 ESP_IDF_PLATFORM_VERSION = cv.Version(5, 4, 0)
 
+_ARDUINO_LOOKUPS = {
+    "dev": (cv.Version(2, 1, 0), "https://github.com/espressif/arduino-esp32.git"),
+    "latest": (cv.Version(2, 0, 9), None),
+    "recommended": (RECOMMENDED_ARDUINO_FRAMEWORK_VERSION, None),
+}
+_ESP_IDF_LOOKUPS = {
+    "dev": (cv.Version(5, 1, 0), "https://github.com/espressif/esp-idf.git"),
+    "latest": (cv.Version(5, 1, 0), None),
+    "recommended": (RECOMMENDED_ESP_IDF_FRAMEWORK_VERSION, None),
+}
 
-def _arduino_check_versions(value):
-    value = value.copy()
-    lookups = {
-        "dev": (cv.Version(2, 1, 0), "https://github.com/espressif/arduino-esp32.git"),
-        "latest": (cv.Version(2, 0, 9), None),
-        "recommended": (RECOMMENDED_ARDUINO_FRAMEWORK_VERSION, None),
-    }
 
-    if value[CONF_VERSION] in lookups:
+@functools.lru_cache(maxsize=32)
+def _is_platformio_version_constraint(value: str) -> bool:
+    try:
+        cv.platformio_version_constraint(value)
+        return True
+    except cv.Invalid:
+        return False
+
+
+def _parse_platform_version(value):
+    # if platform version is a valid version constraint, prefix the default package
+    if isinstance(value, str) and _is_platformio_version_constraint(value):
+        return f"platformio/espressif32@{value}"
+    return value
+
+
+# Default platform packages, resolved once instead of for every validated config
+_PLATFORM_ARDUINO = _parse_platform_version(str(ARDUINO_PLATFORM_VERSION))
+_PLATFORM_ESP_IDF = _parse_platform_version(str(ESP_IDF_PLATFORM_VERSION))
+
+
+def _arduino_check_versions(value):
+    if value[CONF_VERSION] in _ARDUINO_LOOKUPS:
         if CONF_SOURCE in value:
             raise cv.Invalid(
                 "Framework version needs to be explicitly specified when custom source is used."
             )
 
-        version, source = lookups[value[CONF_VERSION]]
+        version, source = _ARDUINO_LOOKUPS[value[CONF_VERSION]]
     else:
         version = cv.Version.parse(cv.version_number(value[CONF_VERSION]))
         source = value.get(CONF_SOURCE, None)
 
+    value = value.copy()
     value[CONF_VERSION] = str(version)
     value[CONF_SOURCE] = source or _format_framework_arduino_version(version)
 
-    value[CONF_PLATFORM_VERSION] = value.get(
-        CONF_PLATFORM_VERSION, _parse_platform_version(str(ARDUINO_PLATFORM_VERSION))
-    )
+    value[CONF_PLATFORM_VERSION] = value.get(CONF_PLATFORM_VERSION, _PLATFORM_ARDUINO)
 
     if version != RECOMMENDED_ARDUINO_FRAMEWORK_VERSION:
         _LOGGER.warning(
@@ -269,20 +296,13 @@ def _arduino_check_versions(value):
 
 
 def _esp_idf_check_versions(value):
-    value = value.copy()
-    lookups = {
-        "dev": (cv.Version(5, 1, 0), "https://github.com/espressif/esp-idf.git"),
-        "latest": (cv.Version(5, 1, 0), None),
-        "recommended": (RECOMMENDED_ESP_IDF_FRAMEWORK_VERSION, None),
-    }
-
-    if value[CONF_VERSION] in lookups:
+    if value[CONF_VERSION] in _ESP_IDF_LOOKUPS:
         if CONF_SOURCE in value:
             raise cv.Invalid(
                 "Framework version needs to be explicitly specified when custom source is used."
             )
 
-        version, source = lookups[value[CONF_VERSION]]
+        version, source = _ESP_IDF_LOOKUPS[value[CONF_VERSION]]
     else:
         version = cv.Version.parse(cv.version_number(value[CONF_VERSION]))
         source = value.get(CONF_SOURCE, None)
@@ -290,12 +310,11 @@ def _esp_idf_check_versions(value):
     if version < cv.Version(4, 0, 0):
         raise cv.Invalid("Only ESP-IDF 4.0+ is supported.")
 
+    value = value.copy()
     value[CONF_VERSION] = str(version)
     value[CONF_SOURCE] = source or _format_framework_espidf_version(version)
 
-    value[CONF_PLATFORM_VERSION] = value.get(
-        CONF_PLATFORM_VERSION, _parse_platform_version(str(ESP_IDF_PLATFORM_VERSION))
-    )
+    value[CONF_PLATFORM_VERSION] = value.get(CONF_PLATFORM_VERSION, _PLATFORM_ESP_IDF)
 
     if version != RECOMMENDED_ESP_IDF_FRAMEWORK_VERSION:
         _LOGGER.warning(
@@ -306,15 +325,6 @@ def _esp_idf_check_versions(value):
     return value
 
 
-def _parse_platform_version(value):
-    try:
-        # if platform version is a valid version constraint, prefix the default package
-        cv.platformio_version_constraint(value)
-        return f"platformio/espressif32@{value}"
-    except cv.Invalid:
-        return value
-
-
 def _detect_variant(value):
     if CONF_VARIANT not in value:
         board = value[CONF_BOARD]
@@ -331,24 +341,18 @@ def _detect_variant(value):
 
 
 def final_validate(config):
-    if CONF_PLATFORMIO_OPTIONS not in fv.full_config.get()[CONF_ESPHOME]:
+    pio_options = fv.full_config.get()[CONF_ESPHOME].get(CONF_PLATFORMIO_OPTIONS)
+    if pio_options is None:
         return config
 
     pio_flash_size_key = "board_upload.flash_size"
     pio_partitions_key = "board_build.partitions"
-    if (
-        CONF_PARTITIONS in config
-        and pio_partitions_key
-        in fv.full_config.get()[CONF_ESPHOME][CONF_PLATFORMIO_OPTIONS]
-    ):
+    if CONF_PARTITIONS in config and pio_partitions_key in pio_options:
         raise cv.Invalid(
             f"Do not specify '{pio_partitions_key}' in '{CONF_PLATFORMIO_OPTIONS}' with '{CONF_PARTITIONS}' in esp32"
         )
 
-    if (
-        pio_flash_size_key
-        in fv.full_config.get()[CONF_ESPHOME][CONF_PLATFORMIO_OPTIONS]
-    ):
+    if pio_flash_size_key in pio_options:
         raise cv.Invalid(
             f"Please specify {CONF_FLASH_SIZE} within esp32 configuration only"
         )
@@ -370,31 +374,29 @@ ARDUINO_FRAMEWORK_SCHEMA = cv.All(
 )
 
 CONF_SDKCONFIG_OPTIONS = "sdkconfig_options"
+_SDKCONFIG_MAP_SCHEMA = cv.Schema({cv.string_strict: cv.string_strict})
+_ESP_IDF_COMPONENT_SCHEMA = cv.Schema(
+    {
+        cv.Required(CONF_NAME): cv.string_strict,
+        cv.Required(CONF_SOURCE): cv.SOURCE_SCHEMA,
+        cv.Optional(CONF_PATH): cv.string,
+        cv.Optional(CONF_REFRESH, default="1d"): cv.All(cv.string, cv.source_refresh),
+    }
+)
 ESP_IDF_FRAMEWORK_SCHEMA = cv.All(
     cv.Schema(
         {
             cv.Optional(CONF_VERSION, default="recommended"): cv.string_strict,
             cv.Optional(CONF_SOURCE): cv.string_strict,
             cv.Optional(CONF_PLATFORM_VERSION): _parse_platform_version,
-            cv.Optional(CONF_SDKCONFIG_OPTIONS, default={}): {
-                cv.string_strict: cv.string_strict
-            },
+            cv.Optional(CONF_SDKCONFIG_OPTIONS, default={}): _SDKCONFIG_MAP_SCHEMA,
             cv.Optional(CONF_ADVANCED, default={}): cv.Schema(
                 {
                     cv.Optional(CONF_IGNORE_EFUSE_MAC_CRC, default=False): cv.boolean,
                 }
             ),
             cv.Optional(CONF_COMPONENTS, default=[]): cv.ensure_list(
-                cv.Schema(
-                    {
-                        cv.Required(CONF_NAME): cv.string_strict,
-                        cv.Required(CONF_SOURCE): cv.SOURCE_SCHEMA,
-                        cv.Optional(CONF_PATH): cv.string,
-                        cv.Optional(CONF_REFRESH, default="1d"): cv.All(
-                            cv.string, cv.source_refresh
-                        ),
-                    }
-                )
+                _ESP_IDF_COMPONENT_SCHEMA
             ),
         }
     ),
@@ -445,118 +447,136 @@ CONFIG_SCHEMA = cv.All(
 FINAL_VALIDATE_SCHEMA = cv.Schema(final_validate)
 
 
-async def to_code(config):
-    cg.add_platformio_option("board", config[CONF_BOARD])
-    cg.add_platformio_option("board_upload.flash_size", config[CONF_FLASH_SIZE])
-    cg.add_build_flag("-DUSE_ESP32")
-    cg.add_define("ESPHOME_BOARD", config[CONF_BOARD])
-    cg.add_build_flag(f"-DUSE_ESP32_VARIANT_{config[CONF_VARIANT]}")
-    cg.add_define("ESPHOME_VARIANT", VARIANT_FRIENDLY[config[CONF_VARIANT]])
+# sdkconfig options set for every esp-idf build
+_IDF_SDKCONFIG_DEFAULTS: dict[str, SdkconfigValueType] = {
+    "CONFIG_PARTITION_TABLE_SINGLE_APP": False,
+    "CONFIG_PARTITION_TABLE_CUSTOM": True,
+    "CONFIG_PARTITION_TABLE_CUSTOM_FILENAME": "partitions.csv",
+    "CONFIG_COMPILER_OPTIMIZATION_DEFAULT": False,
+    "CONFIG_COMPILER_OPTIMIZATION_SIZE": True,
+    # Increase freertos tick speed from 100Hz to 1kHz so that delay() resolution is 1ms
+    "CONFIG_FREERTOS_HZ": 1000,
+    # Setup watchdog
+    "CONFIG_ESP_TASK_WDT": True,
+    "CONFIG_ESP_TASK_WDT_PANIC": True,
+    "CONFIG_ESP_TASK_WDT_CHECK_IDLE_TASK_CPU0": False,
+    "CONFIG_ESP_TASK_WDT_CHECK_IDLE_TASK_CPU1": False,
+}
 
-    cg.add_platformio_option("lib_ldf_mode", "off")
 
-    framework_ver: cv.Version = CORE.data[KEY_CORE][KEY_FRAMEWORK_VERSION]
+def _add_git_idf_component(component, source):
+    add_idf_component(
+        name=component[CONF_NAME],
+        repo=source[CONF_URL],
+        ref=source.get(CONF_REF),
+        path=component.get(CONF_PATH),
+        refresh=component[CONF_REFRESH],
+    )
 
-    conf = config[CONF_FRAMEWORK]
-    cg.add_platformio_option("platform", conf[CONF_PLATFORM_VERSION])
 
-    add_extra_script(
-        "post",
-        "post_build.py",
-        os.path.join(os.path.dirname(__file__), "post_build.py.script"),
+def _add_local_idf_component(component, source):
+    _LOGGER.warning("Local components are not implemented yet.")
+
+
+_IDF_COMPONENT_SOURCE_HANDLERS = {
+    TYPE_GIT: _add_git_idf_component,
+    TYPE_LOCAL: _add_local_idf_component,
+}
+
+
+def _setup_esp_idf(config, conf, framework_ver: cv.Version):
+    cg.add_platformio_option("framework", "espidf")
+    cg.add_build_flags(
+        ["-DUSE_ESP_IDF", "-DUSE_ESP32_FRAMEWORK_ESP_IDF", "-Wno-nonnull-compare"]
     )
+    cg.add_platformio_option(
+        "platform_packages",
+        [f"platformio/framework-espidf@{conf[CONF_SOURCE]}"],
+    )
+    # platformio/toolchain-esp32ulp does not support linux_aarch64 yet and has not been updated for over 2 years
+    # This is espressif's own published version which is more up to date.
+    cg.add_platformio_option(
+        "platform_packages", ["espressif/toolchain-esp32ulp@2.35.0-20220830"]
+    )
+    CORE.data[KEY_ESP32][KEY_SDKCONFIG_OPTIONS].update(_IDF_SDKCONFIG_DEFAULTS)
 
-    if conf[CONF_TYPE] == FRAMEWORK_ESP_IDF:
-        cg.add_platformio_option("framework", "espidf")
-        cg.add_build_flag("-DUSE_ESP_IDF")
-        cg.add_build_flag("-DUSE_ESP32_FRAMEWORK_ESP_IDF")
-        cg.add_build_flag("-Wno-nonnull-compare")
-        cg.add_platformio_option(
-            "platform_packages",
-            [f"platformio/framework-espidf@{conf[CONF_SOURCE]}"],
+    cg.add_platformio_option("board_build.partitions", "partitions.csv")
+    if CONF_PARTITIONS in config:
+        add_extra_build_file(
+            "partitions.csv", CORE.relative_config_path(config[CONF_PARTITIONS])
         )
-        # platformio/toolchain-esp32ulp does not support linux_aarch64 yet and has not been updated for over 2 years
-        # This is espressif's own published version which is more up to date.
-        cg.add_platformio_option(
-            "platform_packages", ["espressif/toolchain-esp32ulp@2.35.0-20220830"]
-        )
-        add_idf_sdkconfig_option("CONFIG_PARTITION_TABLE_SINGLE_APP", False)
-        add_idf_sdkconfig_option("CONFIG_PARTITION_TABLE_CUSTOM", True)
-        add_idf_sdkconfig_option(
-            "CONFIG_PARTITION_TABLE_CUSTOM_FILENAME", "partitions.csv"
-        )
-        add_idf_sdkconfig_option("CONFIG_COMPILER_OPTIMIZATION_DEFAULT", False)
-        add_idf_sdkconfig_option("CONFIG_COMPILER_OPTIMIZATION_SIZE", True)
 
-        # Increase freertos tick speed from 100Hz to 1kHz so that delay() resolution is 1ms
-        add_idf_sdkconfig_option("CONFIG_FREERTOS_HZ", 1000)
+    for name, value in conf[CONF_SDKCONFIG_OPTIONS].items():
+        add_idf_sdkconfig_option(name, RawSdkconfigValue(value))
 
-        # Setup watchdog
-        add_idf_sdkconfig_option("CONFIG_ESP_TASK_WDT", True)
-        add_idf_sdkconfig_option("CONFIG_ESP_TASK_WDT_PANIC", True)
-        add_idf_sdkconfig_option("CONFIG_ESP_TASK_WDT_CHECK_IDLE_TASK_CPU0", False)
-        add_idf_sdkconfig_option("CONFIG_ESP_TASK_WDT_CHECK_IDLE_TASK_CPU1", False)
+    if conf[CONF_ADVANCED][CONF_IGNORE_EFUSE_MAC_CRC]:
+        cg.add_define("USE_ESP32_IGNORE_EFUSE_MAC_CRC")
+        if (framework_ver.major, framework_ver.minor) >= (4, 4):
+            add_idf_sdkconfig_option(
+                "CONFIG_ESP_PHY_CALIBRATION_AND_DATA_STORAGE", False
+            )
+        else:
+            add_idf_sdkconfig_option(
+                "CONFIG_ESP32_PHY_CALIBRATION_AND_DATA_STORAGE", False
+            )
+
+    cg.add_define(
+        "USE_ESP_IDF_VERSION_CODE",
+        cg.RawExpression(
+            f"VERSION_CODE({framework_ver.major}, {framework_ver.minor}, {framework_ver.patch})"
+        ),
+    )
 
+    for component in conf[CONF_COMPONENTS]:
+        source = component[CONF_SOURCE]
+        _IDF_COMPONENT_SOURCE_HANDLERS[source[CONF_TYPE]](component, source)
+
+
+def _setup_arduino(config, conf, framework_ver: cv.Version):
+    cg.add_platformio_option("framework", "arduino")
+    cg.add_build_flags(["-DUSE_ARDUINO", "-DUSE_ESP32_FRAMEWORK_ARDUINO"])
+    cg.add_platformio_option(
+        "platform_packages",
+        [f"platformio/framework-arduinoespressif32@{conf[CONF_SOURCE]}"],
+    )
+
+    if CONF_PARTITIONS in config:
+        cg.add_platformio_option("board_build.partitions", config[CONF_PARTITIONS])
+    else:
         cg.add_platformio_option("board_build.partitions", "partitions.csv")
-        if CONF_PARTITIONS in config:
-            add_extra_build_file(
-                "partitions.csv", CORE.relative_config_path(config[CONF_PARTITIONS])
-            )
 
-        for name, value in conf[CONF_SDKCONFIG_OPTIONS].items():
-            add_idf_sdkconfig_option(name, RawSdkconfigValue(value))
+    cg.add_define(
+        "USE_ARDUINO_VERSION_CODE",
+        cg.RawExpression(
+            f"VERSION_CODE({framework_ver.major}, {framework_ver.minor}, {framework_ver.patch})"
+        ),
+    )
 
-        if conf[CONF_ADVANCED][CONF_IGNORE_EFUSE_MAC_CRC]:
-            cg.add_define("USE_ESP32_IGNORE_EFUSE_MAC_CRC")
-            if (framework_ver.major, framework_ver.minor) >= (4, 4):
-                add_idf_sdkconfig_option(
-                    "CONFIG_ESP_PHY_CALIBRATION_AND_DATA_STORAGE", False
-                )
-            else:
-                add_idf_sdkconfig_option(
-                    "CONFIG_ESP32_PHY_CALIBRATION_AND_DATA_STORAGE", False
-                )
 
-        cg.add_define(
-            "USE_ESP_IDF_VERSION_CODE",
-            cg.RawExpression(
-                f"VERSION_CODE({framework_ver.major}, {framework_ver.minor}, {framework_ver.patch})"
-            ),
-        )
+_FRAMEWORK_SETUP = {
+    FRAMEWORK_ESP_IDF: _setup_esp_idf,
+    FRAMEWORK_ARDUINO: _setup_arduino,
+}
 
-        for component in conf[CONF_COMPONENTS]:
-            source = component[CONF_SOURCE]
-            if source[CONF_TYPE] == TYPE_GIT:
-                add_idf_component(
-                    name=component[CONF_NAME],
-                    repo=source[CONF_URL],
-                    ref=source.get(CONF_REF),
-                    path=component.get(CONF_PATH),
-                    refresh=component[CONF_REFRESH],
-                )
-            elif source[CONF_TYPE] == TYPE_LOCAL:
-                _LOGGER.warning("Local components are not implemented yet.")
 
-    elif conf[CONF_TYPE] == FRAMEWORK_ARDUINO:
-        cg.add_platformio_option("framework", "arduino")
-        cg.add_build_flag("-DUSE_ARDUINO")
-        cg.add_build_flag("-DUSE_ESP32_FRAMEWORK_ARDUINO")
-        cg.add_platformio_option(
-            "platform_packages",
-            [f"platformio/framework-arduinoespressif32@{conf[CONF_SOURCE]}"],
-        )
+async def to_code(config):
+    cg.add_platformio_option("board", config[CONF_BOARD])
+    cg.add_platformio_option("board_upload.flash_size", config[CONF_FLASH_SIZE])
+    cg.add_build_flag("-DUSE_ESP32")
+    cg.add_define("ESPHOME_BOARD", config[CONF_BOARD])
+    cg.add_build_flag(f"-DUSE_ESP32_VARIANT_{config[CONF_VARIANT]}")
+    cg.add_define("ESPHOME_VARIANT", VARIANT_FRIENDLY[config[CONF_VARIANT]])
 
-        if CONF_PARTITIONS in config:
-            cg.add_platformio_option("board_build.partitions", config[CONF_PARTITIONS])
-        else:
-            cg.add_platformio_option("board_build.partitions", "partitions.csv")
+    cg.add_platformio_option("lib_ldf_mode", "off")
 
-        cg.add_define(
-            "USE_ARDUINO_VERSION_CODE",
-            cg.RawExpression(
-                f"VERSION_CODE({framework_ver.major}, {framework_ver.minor}, {framework_ver.patch})"
-            ),
-        )
+    framework_ver: cv.Version = CORE.data[KEY_CORE][KEY_FRAMEWORK_VERSION]
+
+    conf = config[CONF_FRAMEWORK]
+    cg.add_platformio_option("platform", conf[CONF_PLATFORM_VERSION])
+
+    add_extra_script("post", "post_build.py", _POST_BUILD_SCRIPT)
+
+    _FRAMEWORK_SETUP[conf[CONF_TYPE]](config, conf, framework_ver)
 
 
 APP_PARTITION_SIZES = {
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 
@@ -29,46 +30,57 @@ from .const import (
 )
 from .boards import BOARDS, ESP8266_LD_SCRIPTS
 
-from .gpio import PinInitialState, add_pin_initial_states_array
+from .gpio import LazyPinStates, add_pin_initial_states_array
 
 
 CODEOWNERS = ["@esphome/core"]
 _LOGGER = logging.getLogger(__name__)
 AUTO_LOAD = ["preferences"]
 
+_POST_BUILD_SCRIPT = os.path.join(os.path.dirname(__file__), "post_build.py.script")
+
+# Arduino framework version boundaries, compared against on every config
+_V_1_8_0 = cv.Version(1, 8, 0)
+_V_2_3_0 = cv.Version(2, 3, 0)
+_V_2_4_1 = cv.Version(2, 4, 1)
+_V_2_4_2 = cv.Version(2, 4, 2)
+_V_2_5_0 = cv.Version(2, 5, 0)
+_V_2_6_2 = cv.Version(2, 6, 2)
+_V_3_0_0 = cv.Version(3, 0, 0)
+
 
 def set_core_data(config):
-    CORE.data[KEY_ESP8266] = {}
-    CORE.data[KEY_CORE][KEY_TARGET_PLATFORM] = PLATFORM_ESP8266
-    CORE.data[KEY_CORE][KEY_TARGET_FRAMEWORK] = "arduino"
-    CORE.data[KEY_CORE][KEY_FRAMEWORK_VERSION] = cv.Version.parse(
+    core_data = CORE.data[KEY_CORE]
+    core_data[KEY_TARGET_PLATFORM] = PLATFORM_ESP8266
+    core_data[KEY_TARGET_FRAMEWORK] = "arduino"
+    core_data[KEY_FRAMEWORK_VERSION] = cv.Version.parse(
         config[CONF_FRAMEWORK][CONF_VERSION]
     )
-    CORE.data[KEY_ESP8266][KEY_BOARD] = config[CONF_BOARD]
-    CORE.data[KEY_ESP8266][KEY_PIN_INITIAL_STATES] = [
-        PinInitialState() for _ in range(16)
-    ]
+    CORE.data[KEY_ESP8266] = {
+        KEY_BOARD: config[CONF_BOARD],
+        KEY_PIN_INITIAL_STATES: LazyPinStates(16),
+    }
     return config
 
 
+_DOWNLOAD_TYPE = {
+    "title": "Standard format",
+    "description": "For flashing ESP8266.",
+    "file": "firmware.bin",
+}
+
+
 def get_download_types(storage_json):
-    return [
-        {
-            "title": "Standard format",
-            "description": "For flashing ESP8266.",
-            "file": "firmware.bin",
-            "download": f"{storage_json.name}.bin",
-        },
-    ]
+    return [{**_DOWNLOAD_TYPE, "download": f"{storage_json.name}.bin"}]
 
 
 def _format_framework_arduino_version(ver: cv.Version) -> str:
     # format the given arduino (https://github.com/esp8266/Arduino/releases) version to
     # a PIO platformio/framework-arduinoespressif8266 value
     # List of package versions: https://api.registry.platformio.org/v3/packages/platformio/tool/framework-arduinoespressif8266
-    if ver <= cv.Version(2, 4, 1):
+    if ver <= _V_2_4_1:
         return f"~1.{ver.major}{ver.minor:02d}{ver.patch:02d}.0"
-    if ver <= cv.Version(2, 6, 2):
+    if ver <= _V_2_6_2:
         return f"~2.{ver.major}{ver.minor:02d}{ver.patch:02d}.0"
     return f"~3.{ver.major}{ver.minor:02d}{ver.patch:02d}.0"
 
@@ -91,37 +103,59 @@ ARDUINO_2_PLATFORM_VERSION = cv.Version(2, 6, 3)
 # for arduino 3 framework versions
 ARDUINO_3_PLATFORM_VERSION = cv.Version(3, 2, 0)
 
+_ARDUINO_LOOKUPS = {
+    "dev": (cv.Version(3, 0, 2), "https://github.com/esp8266/Arduino.git"),
+    "latest": (cv.Version(3, 0, 2), None),
+    "recommended": (RECOMMENDED_ARDUINO_FRAMEWORK_VERSION, None),
+}
 
-def _arduino_check_versions(value):
-    value = value.copy()
-    lookups = {
-        "dev": (cv.Version(3, 0, 2), "https://github.com/esp8266/Arduino.git"),
-        "latest": (cv.Version(3, 0, 2), None),
-        "recommended": (RECOMMENDED_ARDUINO_FRAMEWORK_VERSION, None),
-    }
 
-    if value[CONF_VERSION] in lookups:
+@functools.lru_cache(maxsize=32)
+def _is_platformio_version_constraint(value: str) -> bool:
+    try:
+        cv.platformio_version_constraint(value)
+        return True
+    except cv.Invalid:
+        return False
+
+
+def _parse_platform_version(value):
+    # if platform version is a valid version constraint, prefix the default package
+    if isinstance(value, str) and _is_platformio_version_constraint(value):
+        return f"platformio/espressif8266@{value}"
+    return value
+
+
+# Default platform packages, resolved once instead of for every validated config
+_PLATFORM_ARDUINO_3 = _parse_platform_version(str(ARDUINO_3_PLATFORM_VERSION))
+_PLATFORM_ARDUINO_2 = _parse_platform_version(str(ARDUINO_2_PLATFORM_VERSION))
+_PLATFORM_ARDUINO_1_8 = _parse_platform_version(str(_V_1_8_0))
+
+
+def _arduino_check_versions(value):
+    if value[CONF_VERSION] in _ARDUINO_LOOKUPS:
         if CONF_SOURCE in value:
             raise cv.Invalid(
                 "Framework version needs to be explicitly specified when custom source is used."
             )
 
-        version, source = lookups[value[CONF_VERSION]]
+        version, source = _ARDUINO_LOOKUPS[value[CONF_VERSION]]
     else:
         version = cv.Version.parse(cv.version_number(value[CONF_VERSION]))
         source = value.get(CONF_SOURCE, None)
 
+    value = value.copy()
     value[CONF_VERSION] = str(version)
     value[CONF_SOURCE] = source or _format_framework_arduino_version(version)
 
     platform_version = value.get(CONF_PLATFORM_VERSION)
     if platform_version is None:
-        if version >= cv.Version(3, 0, 0):
-            platform_version = _parse_platform_version(str(ARDUINO_3_PLATFORM_VERSION))
-        elif version >= cv.Version(2, 5, 0):
-            platform_version = _parse_platform_version(str(ARDUINO_2_PLATFORM_VERSION))
+        if version >= _V_3_0_0:
+            platform_version = _PLATFORM_ARDUINO_3
+        elif version >= _V_2_5_0:
+            platform_version = _PLATFORM_ARDUINO_2
         else:
-            platform_version = _parse_platform_version(str(cv.Version(1, 8, 0)))
+            platform_version = _PLATFORM_ARDUINO_1_8
     value[CONF_PLATFORM_VERSION] = platform_version
 
     if version != RECOMMENDED_ARDUINO_FRAMEWORK_VERSION:
@@ -133,15 +167,6 @@ def _arduino_check_versions(value):
     return value
 
 
-def _parse_platform_version(value):
-    try:
-        # if platform version is a valid version constraint, prefix the default package
-        cv.platformio_version_constraint(value)
-        return f"platformio/espressif8266@{value}"
-    except cv.Invalid:
-        return value
-
-
 CONF_PLATFORM_VERSION = "platform_version"
 ARDUINO_FRAMEWORK_SCHEMA = cv.All(
     cv.Schema(
@@ -172,6 +197,12 @@ CONFIG_SCHEMA = cv.All(
 )
 
 
+# (old, new) ld script paths of every known board
+_BOARD_LD_SCRIPTS = {
+    board: ESP8266_LD_SCRIPTS[info[KEY_FLASH_SIZE]] for board, info in BOARDS.items()
+}
+
+
 @coroutine_with_priority(1000)
 async def to_code(config):
     cg.add(esp8266_ns.setup_preferences())
@@ -187,9 +218,9 @@ async def to_code(config):
 
     conf = config[CONF_FRAMEWORK]
     cg.add_platformio_option("framework", "arduino")
-    cg.add_build_flag("-DUSE_ARDUINO")
-    cg.add_build_flag("-DUSE_ESP8266_FRAMEWORK_ARDUINO")
-    cg.add_build_flag("-Wno-nonnull-compare")
+    cg.add_build_flags(
+        ["-DUSE_ARDUINO", "-DUSE_ESP8266_FRAMEWORK_ARDUINO", "-Wno-nonnull-compare"]
+    )
     cg.add_platformio_option("platform", conf[CONF_PLATFORM_VERSION])
     cg.add_platformio_option(
         "platform_packages",
@@ -231,14 +262,12 @@ async def to_code(config):
         cg.RawExpression(f"VERSION_CODE({ver.major}, {ver.minor}, {ver.patch})"),
     )
 
-    if config[CONF_BOARD] in BOARDS:
-        flash_size = BOARDS[config[CONF_BOARD]][KEY_FLASH_SIZE]
-        ld_scripts = ESP8266_LD_SCRIPTS[flash_size]
-
-        if ver <= cv.Version(2, 3, 0):
+    ld_scripts = _BOARD_LD_SCRIPTS.get(config[CONF_BOARD])
+    if ld_scripts is not None:
+        if ver <= _V_2_3_0:
             # No ld script support
             ld_script = None
-        if ver <= cv.Version(2, 4, 2):
+        elif ver <= _V_2_4_2:
             # Old ld script path
             ld_script = ld_scripts[0]
         else:
@@ -252,9 +281,7 @@ async def to_code(config):
 
 # Called by writer.py
 def copy_files():
-    dir = os.path.dirname(__file__)
-    post_build_file = os.path.join(dir, "post_build.py.script")
     copy_file_if_changed(
-        post_build_file,
+        _POST_BUILD_SCRIPT,
         CORE.relative_build_path("post_build.py"),
     )
@@ -1,5 +1,7 @@
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Optional
 
 from esphome.const import (
     CONF_ANALOG,
@@ -158,6 +160,29 @@ class PinInitialState:
     level: int = 255
 
 
+class LazyPinStates:
+    """Per-pin initial states, allocated when a pin is first accessed.
+
+    Iterating yields a default PinInitialState for pins that were never accessed.
+    """
+
+    def __init__(self, count: int):
+        self._states: list[Optional[PinInitialState]] = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __getitem__(self, index: int) -> PinInitialState:
+        state = self._states[index]
+        if state is None:
+            state = self._states[index] = PinInitialState()
+        return state
+
+    def __iter__(self) -> Iterator[PinInitialState]:
+        for state in self._states:
+            yield PinInitialState() if state is None else state
+
+
 @pins.PIN_SCHEMA_REGISTRY.register(PLATFORM_ESP8266, ESP8266_PIN_SCHEMA)
 async def esp8266_pin_to_code(config):
     var = cg.new_Pvariable(config[CONF_ID])
@@ -190,9 +215,9 @@ async def esp8266_pin_to_code(config):
 @coroutine_with_priority(-999.0)
 async def add_pin_initial_states_array():
     # Add includes at the very end, so that they override everything
-    initial_states: list[PinInitialState] = CORE.data[KEY_ESP8266][
-        KEY_PIN_INITIAL_STATES
-    ]
+    initial_states: list[PinInitialState] = list(
+        CORE.data[KEY_ESP8266][KEY_PIN_INITIAL_STATES]
+    )
     initial_modes_s = ", ".join(str(x.mode) for x in initial_states)
     initial_levels_s = ", ".join(str(x.level) for x in initial_states)
 
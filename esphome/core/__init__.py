@@ -761,6 +761,16 @@ class EsphomeCore:
         _LOGGER.debug("Adding build flag: %s", build_flag)
         return build_flag
 
+    def add_build_flags(self, build_flags):
+        if isinstance(build_flags, str):
+            raise ValueError(
+                f"Build flags {build_flags!r} must be an iterable of strings, not a string"
+            )
+        build_flags = list(build_flags)
+        self.build_flags.update(build_flags)
+        _LOGGER.debug("Adding build flags: %s", build_flags)
+        return build_flags
+
     def add_define(self, define):
         if isinstance(define, str):
             define = Define(define)
@@ -2,7 +2,7 @@ import abc
 import inspect
 import math
 import re
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable, Sequence
 from typing import Any, Callable, Optional, Union
 
 from esphome.core import (
@@ -608,6 +608,11 @@ def add_build_flag(build_flag: str):
     CORE.add_build_flag(build_flag)
 
 
+def add_build_flags(build_flags: Iterable[str]):
+    """Add several global build flags to the compiler flags at once."""
+    CORE.add_build_flags(build_flags)
+
+
 def add_define(name: str, value: SafeExpType = None):
     """Add a global define to the auto-generated defines.h file.
 
@@ -26,6 +26,7 @@ from esphome import codegen as cg
         "add_global",
         "add_library",
         "add_build_flag",
+        "add_build_flags",
         "add_define",
         "get_variable",
         "get_variable_with_full_id",
@@ -543,3 +543,16 @@ class TestEsphomeCore:
 
         assert target.is_esp32 is False
         assert target.is_esp8266 is True
+
+    def test_add_build_flags(self, target):
+        target.add_build_flag("-DFOO")
+        actual = target.add_build_flags(f for f in ("-DFOO", "-DBAR"))
+
+        assert actual == ["-DFOO", "-DBAR"]
+        assert target.build_flags == {"-DFOO", "-DBAR"}
+
+    def test_add_build_flags__string(self, target):
+        with pytest.raises(ValueError):
+            target.add_build_flags("-DFOO")
+
+        assert target.build_flags == set()